@@ -1,12 +1,38 @@
 """Support to control a Salda Smarty XP/XV ventilation unit."""
 
 import asyncio
+import logging
+import time
 
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from .const import CONF_SLAVES, DEFAULT_SLAVE
-from .coordinator import SmartyConfigEntry, SmartyCoordinator
+from .const import (
+    CONF_BUS_BUDGET,
+    DEFAULT_BUS_BUDGET,
+    DOMAIN,
+    SIGNAL_ADD_SLAVE,
+)
+from .coordinator import (
+    SmartyConfigEntry,
+    SmartyCoordinator,
+    SmartyData,
+    get_slaves,
+)
+from .limiter import BusLimiter
+from .services import async_setup_services
+
+_LOGGER = logging.getLogger(__name__)
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 PLATFORMS = [
     Platform.BINARY_SENSOR,
@@ -17,28 +43,123 @@ PLATFORMS = [
 ]
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Smarty integration."""
+    async_setup_services(hass)
+    return True
+
+
+def _platforms_to_load(hass: HomeAssistant, entry: SmartyConfigEntry) -> list[Platform]:
+    """Return the platforms that have at least one entity to set up.
+
+    A platform is skipped when all of its registered entities are disabled.
+    """
+    entities = er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+    platforms: list[Platform] = []
+    for platform in PLATFORMS:
+        registered = [entity for entity in entities if entity.domain == platform]
+        if not registered or any(entity.disabled_by is None for entity in registered):
+            platforms.append(platform)
+    return platforms
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: SmartyConfigEntry) -> bool:
     """Set up the Smarty environment from a config entry."""
-    # Get slaves list, with backward compatibility for existing configs
-    slaves: list[int] = entry.data.get(CONF_SLAVES, [DEFAULT_SLAVE])
-
-    # Shared lock to serialize Modbus requests and avoid conflicts
-    modbus_lock = asyncio.Lock()
+    slaves = get_slaves(entry)
+    start = time.perf_counter()
 
-    coordinators: dict[int, SmartyCoordinator] = {}
+    data = SmartyData(
+        coordinators={},
+        # Shared lock to serialize Modbus requests and avoid conflicts
+        modbus_lock=asyncio.Lock(),
+        # Shared budget so all slaves together stay within the gateway capacity
+        limiter=BusLimiter(entry.options.get(CONF_BUS_BUDGET, DEFAULT_BUS_BUDGET)),
+    )
 
     for slave in slaves:
-        coordinator = SmartyCoordinator(hass, entry, slave, modbus_lock)
+        coordinator = SmartyCoordinator(
+            hass, entry, slave, data.modbus_lock, data.limiter
+        )
         await coordinator.async_config_entry_first_refresh()
-        coordinators[slave] = coordinator
+        data.coordinators[slave] = coordinator
+
+    entry.runtime_data = data
 
-    entry.runtime_data = coordinators
+    refreshed = time.perf_counter()
+    data.platforms = _platforms_to_load(hass, entry)
+    await hass.config_entries.async_forward_entry_setups(entry, data.platforms)
+    end = time.perf_counter()
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    _LOGGER.debug(
+        "Set up %d slaves in %.1f ms per slave (%.1f ms first refresh, "
+        "%.1f ms entities), platforms: %s",
+        len(slaves),
+        (end - start) * 1000 / len(slaves),
+        (refreshed - start) * 1000 / len(slaves),
+        (end - refreshed) * 1000 / len(slaves),
+        ", ".join(data.platforms),
+    )
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: SmartyConfigEntry) -> None:
+    """Add and remove only the affected slaves and retune the others."""
+    async with entry.runtime_data.options_lock:
+        await _async_apply_options(hass, entry)
+
+
+async def _async_apply_options(hass: HomeAssistant, entry: SmartyConfigEntry) -> None:
+    """Apply the entry options to the running coordinators."""
+    data = entry.runtime_data
+    coordinators = data.coordinators
+    slaves = get_slaves(entry)
+
+    data.limiter.set_rate(entry.options.get(CONF_BUS_BUDGET, DEFAULT_BUS_BUDGET))
+
+    for slave, coordinator in coordinators.items():
+        if slave in slaves:
+            coordinator.apply_options(entry.options)
+
+    for slave in slaves:
+        if slave in coordinators:
+            continue
+        coordinator = SmartyCoordinator(
+            hass, entry, slave, data.modbus_lock, data.limiter
+        )
+        try:
+            await coordinator.async_start()
+        except UpdateFailed as err:
+            _LOGGER.error("Slave %d: Could not be added: %s", slave, err)
+            continue
+        coordinators[slave] = coordinator
+        async_dispatcher_send(
+            hass, SIGNAL_ADD_SLAVE.format(entry.entry_id), coordinator
+        )
+        # Platforms skipped at setup have no listener, load them for the new slave
+        if missing := [
+            platform for platform in PLATFORMS if platform not in data.platforms
+        ]:
+            data.platforms.extend(missing)
+            await hass.config_entries.async_forward_entry_setups(entry, missing)
+
+    device_registry = dr.async_get(hass)
+    for slave in [slave for slave in coordinators if slave not in slaves]:
+        coordinator = coordinators.pop(slave)
+        await coordinator.async_shutdown()
+        # Removing the device also removes its entities
+        if device := device_registry.async_get_device(
+            identifiers={(DOMAIN, f"{entry.entry_id}_{slave}")}
+        ):
+            device_registry.async_update_device(
+                device.id, remove_config_entry_id=entry.entry_id
+            )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: SmartyConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    return await hass.config_entries.async_unload_platforms(
+        entry, entry.runtime_data.platforms
+    )
@@ -13,11 +13,12 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .coordinator import SmartyConfigEntry, SmartyCoordinator
-from .entity import SmartyEntity
+from .entity import SmartyEntity, async_setup_slave_entities, slave_unique_id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -51,12 +52,16 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up the Smarty Binary Sensor Platform."""
-    coordinators = entry.runtime_data
-
-    async_add_entities(
-        SmartyBinarySensor(coordinator, description)
-        for coordinator in coordinators.values()
-        for description in ENTITIES
+    async_setup_slave_entities(
+        hass,
+        entry,
+        async_add_entities,
+        Platform.BINARY_SENSOR,
+        lambda coordinator, enabled: (
+            SmartyBinarySensor(coordinator, description)
+            for description in ENTITIES
+            if enabled(slave_unique_id(coordinator, description.key))
+        ),
     )
 
 
@@ -73,9 +78,7 @@ class SmartyBinarySensor(SmartyEntity, BinarySensorEntity):
         """Initialize the entity."""
         super().__init__(coordinator)
         self.entity_description = entity_description
-        self._attr_unique_id = (
-            f"{coordinator.config_entry.entry_id}_{coordinator.slave}_{entity_description.key}"
-        )
+        self._attr_unique_id = slave_unique_id(coordinator, entity_description.key)
 
     @property
     def is_on(self) -> bool:
@@ -10,11 +10,12 @@ from typing import Any
 from pysmarty2 import Smarty
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .coordinator import SmartyConfigEntry, SmartyCoordinator
-from .entity import SmartyEntity
+from .entity import SmartyEntity, async_setup_slave_entities, slave_unique_id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,12 +42,16 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up the Smarty Button Platform."""
-    coordinators = entry.runtime_data
-
-    async_add_entities(
-        SmartyButton(coordinator, description)
-        for coordinator in coordinators.values()
-        for description in ENTITIES
+    async_setup_slave_entities(
+        hass,
+        entry,
+        async_add_entities,
+        Platform.BUTTON,
+        lambda coordinator, enabled: (
+            SmartyButton(coordinator, description)
+            for description in ENTITIES
+            if enabled(slave_unique_id(coordinator, description.key))
+        ),
     )
 
 
@@ -63,9 +68,7 @@ class SmartyButton(SmartyEntity, ButtonEntity):
         """Initialize the entity."""
         super().__init__(coordinator)
         self.entity_description = entity_description
-        self._attr_unique_id = (
-            f"{coordinator.config_entry.entry_id}_{coordinator.slave}_{entity_description.key}"
-        )
+        self._attr_unique_id = slave_unique_id(coordinator, entity_description.key)
 
     async def async_press(self, **kwargs: Any) -> None:
         """Press the button."""
@@ -1,15 +1,37 @@
 """Config flow for Smarty integration."""
 
+from __future__ import annotations
+
 import logging
 from typing import Any
 
 from pysmarty2 import Smarty
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
-from homeassistant.const import CONF_HOST
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.const import CONF_HOST, CONF_SCAN_INTERVAL
+from homeassistant.core import callback
 
-from .const import CONF_SLAVES, DEFAULT_SLAVE, DOMAIN
+from .const import (
+    CONF_BUS_BUDGET,
+    CONF_MAX_TIMEOUT,
+    CONF_MIN_TIMEOUT,
+    CONF_RETRIES,
+    CONF_SLAVES,
+    DEFAULT_BUS_BUDGET,
+    DEFAULT_MAX_TIMEOUT,
+    DEFAULT_MIN_TIMEOUT,
+    DEFAULT_RETRIES,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SLAVE,
+    DOMAIN,
+)
+from .coordinator import get_slaves
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,20 +48,27 @@ def _parse_slaves(slaves_str: str) -> list[int] | None:
     return None
 
 
+def _test_connection(host: str, device_id: int) -> str | None:
+    """Test the connection to the Smarty API."""
+    smarty = Smarty(host=host, device_id=device_id)
+    try:
+        if smarty.update():
+            return None
+    except Exception:
+        _LOGGER.exception("Unexpected exception")
+        return "unknown"
+    else:
+        return "cannot_connect"
+
+
 class SmartyConfigFlow(ConfigFlow, domain=DOMAIN):
     """Smarty config flow."""
 
-    def _test_connection(self, host: str, device_id: int) -> str | None:
-        """Test the connection to the Smarty API."""
-        smarty = Smarty(host=host, device_id=device_id)
-        try:
-            if smarty.update():
-                return None
-        except Exception:
-            _LOGGER.exception("Unexpected exception")
-            return "unknown"
-        else:
-            return "cannot_connect"
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> SmartyOptionsFlow:
+        """Create the options flow."""
+        return SmartyOptionsFlow()
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -57,7 +86,7 @@ class SmartyConfigFlow(ConfigFlow, domain=DOMAIN):
             else:
                 # Test connection with first slave
                 error = await self.hass.async_add_executor_job(
-                    self._test_connection, user_input[CONF_HOST], slaves[0]
+                    _test_connection, user_input[CONF_HOST], slaves[0]
                 )
                 if not error:
                     # Store parsed slaves list
@@ -78,4 +107,59 @@ class SmartyConfigFlow(ConfigFlow, domain=DOMAIN):
                 vol.Optional(CONF_SLAVES, default=str(DEFAULT_SLAVE)): str,
             }),
             errors=errors,
-        )
\ No newline at end of file
+        )
+
+
+class SmartyOptionsFlow(OptionsFlow):
+    """Smarty options flow."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the slaves and polling options."""
+        errors: dict[str, str] = {}
+        current_slaves = get_slaves(self.config_entry)
+
+        if user_input is not None:
+            slaves = _parse_slaves(user_input[CONF_SLAVES])
+
+            if slaves is None:
+                errors[CONF_SLAVES] = "invalid_slaves"
+            elif user_input[CONF_MIN_TIMEOUT] > user_input[CONF_MAX_TIMEOUT]:
+                errors[CONF_MAX_TIMEOUT] = "invalid_timeouts"
+            else:
+                # New slaves are not probed here, that would bypass the Modbus
+                # lock. The update listener reads them under the lock instead.
+                return self.async_create_entry(data={**user_input, CONF_SLAVES: slaves})
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_SLAVES,
+                    default=", ".join(str(slave) for slave in current_slaves),
+                ): str,
+                vol.Required(
+                    CONF_SCAN_INTERVAL,
+                    default=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                vol.Required(
+                    CONF_RETRIES,
+                    default=options.get(CONF_RETRIES, DEFAULT_RETRIES),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=10)),
+                vol.Required(
+                    CONF_MIN_TIMEOUT,
+                    default=options.get(CONF_MIN_TIMEOUT, DEFAULT_MIN_TIMEOUT),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=30)),
+                vol.Required(
+                    CONF_MAX_TIMEOUT,
+                    default=options.get(CONF_MAX_TIMEOUT, DEFAULT_MAX_TIMEOUT),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=30)),
+                vol.Required(
+                    CONF_BUS_BUDGET,
+                    default=options.get(CONF_BUS_BUDGET, DEFAULT_BUS_BUDGET),
+                ): vol.All(vol.Coerce(float), vol.Range(min=1, max=100)),
+            }),
+            errors=errors,
+        )
@@ -2,4 +2,15 @@
 
 DOMAIN = "salda_smarty"
 CONF_SLAVES = "slaves"
+CONF_RETRIES = "retries"
+CONF_MIN_TIMEOUT = "min_timeout"
+CONF_MAX_TIMEOUT = "max_timeout"
+CONF_BUS_BUDGET = "bus_budget"
 DEFAULT_SLAVE = 1
+DEFAULT_SCAN_INTERVAL = 30  # seconds
+DEFAULT_RETRIES = 3
+DEFAULT_MIN_TIMEOUT = 0.5  # seconds
+DEFAULT_MAX_TIMEOUT = 5.0  # seconds
+DEFAULT_BUS_BUDGET = 10.0  # transactions per second
+
+SIGNAL_ADD_SLAVE = f"{DOMAIN}_add_slave_{{}}"
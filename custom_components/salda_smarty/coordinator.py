@@ -1,23 +1,103 @@
 """Smarty Coordinator."""
 
 import asyncio
+from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import Any, Callable
+from typing import Any, Callable, Mapping
 import logging
+import time
 
 from pysmarty2 import Smarty
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_HOST, CONF_SCAN_INTERVAL, Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .const import (
+    CONF_MAX_TIMEOUT,
+    CONF_MIN_TIMEOUT,
+    CONF_RETRIES,
+    CONF_SLAVES,
+    DEFAULT_MAX_TIMEOUT,
+    DEFAULT_MIN_TIMEOUT,
+    DEFAULT_RETRIES,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SLAVE,
+    DOMAIN,
+)
+from .history import RollingWindow
+from .limiter import BusLimiter
+from .profiler import NULL_CYCLE, NullProfileCycle, SmartyProfiler
+from .rtt import RttEstimator
+
 _LOGGER = logging.getLogger(__name__)
 
-MAX_RETRIES = 3
 RETRY_DELAY = 2.0  # seconds between retries
+# Socket operations in a full register update: one connect plus seven reads
+UPDATE_TRANSACTIONS = 8
+# Socket operations in a command: one connect plus one write
+COMMAND_TRANSACTIONS = 2
+
+HISTORY_WINDOW = 3600  # seconds
+# Shortest poll interval allowed by the options flow. Refreshes requested
+# by commands come on top of the polls, samples closer together than this
+# are not recorded so the buffer always spans the whole window.
+HISTORY_SPACING = 5  # seconds
+HISTORY_CAPACITY = HISTORY_WINDOW // HISTORY_SPACING + 1
+HISTORY_METRICS: dict[str, Callable[[Smarty], float | None]] = {
+    "supply_air_temperature": lambda smarty: smarty.supply_air_temperature,
+    "extract_air_temperature": lambda smarty: smarty.extract_air_temperature,
+    "outdoor_air_temperature": lambda smarty: smarty.outdoor_air_temperature,
+    "supply_fan_speed": lambda smarty: smarty.supply_fan_speed,
+    "extract_fan_speed": lambda smarty: smarty.extract_fan_speed,
+}
+
+type SmartyConfigEntry = ConfigEntry[SmartyData]
+
+
+def get_slaves(entry: ConfigEntry) -> list[int]:
+    """Return the configured slaves, preferring the entry options."""
+    # Backward compatibility for configs created before slaves were options
+    return entry.options.get(CONF_SLAVES, entry.data.get(CONF_SLAVES, [DEFAULT_SLAVE]))
+
+
+def _count_transactions(client: Smarty) -> list[int]:
+    """Count the Modbus transactions a client sends, in a one item list.
+
+    pymodbus calls connect before every request, only a connect that has to
+    open the socket is a transaction of its own.
+    """
+    count = [0]
+    modbus_client = client.connection.client
+    connect = modbus_client.connect
+    execute = modbus_client.execute
+
+    def _connect(*args: Any, **kwargs: Any) -> Any:
+        if getattr(modbus_client, "socket", None) is None:
+            count[0] += 1
+        return connect(*args, **kwargs)
+
+    def _execute(*args: Any, **kwargs: Any) -> Any:
+        count[0] += 1
+        return execute(*args, **kwargs)
+
+    modbus_client.connect = _connect
+    modbus_client.execute = _execute
+    return count
+
+
+@dataclass
+class SmartyData:
+    """Runtime data shared by the slaves of one gateway."""
 
-type SmartyConfigEntry = ConfigEntry[dict[int, "SmartyCoordinator"]]
+    coordinators: dict[int, "SmartyCoordinator"]
+    modbus_lock: asyncio.Lock
+    limiter: BusLimiter
+    platforms: list[Platform] = field(default_factory=list)
+    # Serializes option updates, they await while adding slaves
+    options_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
 
 class SmartyCoordinator(DataUpdateCoordinator[None]):
@@ -26,6 +106,7 @@ class SmartyCoordinator(DataUpdateCoordinator[None]):
     config_entry: SmartyConfigEntry
     software_version: str
     configuration_version: str
+    device_info: DeviceInfo
 
     def __init__(
         self,
@@ -33,6 +114,7 @@ class SmartyCoordinator(DataUpdateCoordinator[None]):
         config_entry: SmartyConfigEntry,
         slave: int,
         modbus_lock: asyncio.Lock,
+        limiter: BusLimiter,
     ) -> None:
         """Initialize."""
         super().__init__(
@@ -40,21 +122,72 @@ class SmartyCoordinator(DataUpdateCoordinator[None]):
             logger=_LOGGER,
             config_entry=config_entry,
             name=f"Smarty (Slave {slave})",
-            update_interval=timedelta(seconds=30),
+            update_interval=timedelta(
+                seconds=config_entry.options.get(
+                    CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+                )
+            ),
         )
         self.slave = slave
         self.client = Smarty(host=config_entry.data[CONF_HOST], device_id=slave)
         self._modbus_lock = modbus_lock
+        self._limiter = limiter
+        self.max_retries: int = config_entry.options.get(CONF_RETRIES, DEFAULT_RETRIES)
+        self.rtt = RttEstimator(
+            min_timeout=config_entry.options.get(CONF_MIN_TIMEOUT, DEFAULT_MIN_TIMEOUT),
+            max_timeout=config_entry.options.get(CONF_MAX_TIMEOUT, DEFAULT_MAX_TIMEOUT),
+        )
+        self.history = {
+            key: RollingWindow(HISTORY_CAPACITY, HISTORY_WINDOW)
+            for key in HISTORY_METRICS
+        }
+        self._history_recorded: float | None = None
+        # Set by the profile service, None keeps the hot paths unchanged
+        self.profiler: SmartyProfiler | None = None
+
+    def apply_options(self, options: Mapping[str, Any]) -> None:
+        """Retune polling and timeouts in place from the entry options."""
+        self.update_interval = timedelta(
+            seconds=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+        self.max_retries = options.get(CONF_RETRIES, DEFAULT_RETRIES)
+        self.rtt.set_bounds(
+            options.get(CONF_MIN_TIMEOUT, DEFAULT_MIN_TIMEOUT),
+            options.get(CONF_MAX_TIMEOUT, DEFAULT_MAX_TIMEOUT),
+        )
+
+    def _create_client(self, timeout: float) -> Smarty:
+        """Create a client whose socket operations use the given timeout."""
+        client = Smarty(host=self.config_entry.data[CONF_HOST], device_id=self.slave)
+        # pysmarty2 does not expose the timeout, set it on the pymodbus client
+        # before the connection is opened.
+        modbus_client = client.connection.client
+        if hasattr(modbus_client, "comm_params"):
+            modbus_client.comm_params.timeout_connect = timeout
+        # The coordinator retries whole updates itself, pymodbus would
+        # otherwise resend every timed out read three more times.
+        if hasattr(modbus_client, "retries"):
+            modbus_client.retries = 0
+        transaction = getattr(modbus_client, "transaction", None)
+        if hasattr(transaction, "retries"):
+            transaction.retries = 0
+        return client
 
-    def _update_once(self) -> Smarty | None:
+    def _update_once(
+        self, timeout: float, cycle: NullProfileCycle
+    ) -> tuple[Smarty | None, float, int]:
         """Perform a single update attempt with a fresh client.
         
-        Returns the updated client if successful, None otherwise.
+        Returns the updated client if successful, None otherwise, together
+        with the time the attempt took and the transactions it sent.
         """
-        client = Smarty(host=self.config_entry.data[CONF_HOST], device_id=self.slave)
+        start = time.monotonic()
+        client = self._create_client(timeout)
+        transactions = _count_transactions(client)
+        cycle.instrument(client)
         try:
             if client.update():
-                return client
+                return client, time.monotonic() - start, transactions[0]
         except Exception as err:
             _LOGGER.debug(
                 "Slave %d: Update attempt failed with error: %s",
@@ -68,18 +201,30 @@ class SmartyCoordinator(DataUpdateCoordinator[None]):
                 client.connection.close()
             except Exception:  # noqa: BLE001
                 pass
-        return None
+        return None, time.monotonic() - start, transactions[0]
 
-    async def _async_update_with_retry(self) -> None:
+    async def _async_update_with_retry(
+        self, cycle: NullProfileCycle = NULL_CYCLE
+    ) -> None:
         """Update data with retry logic and on-demand connection.
         
         Creates a fresh connection for the update and closes it afterwards.
         Raises UpdateFailed if all retry attempts fail.
         """
-        for attempt in range(1, MAX_RETRIES + 1):
-            updated_client = await self.hass.async_add_executor_job(self._update_once)
+        self.rtt.reset()
+        for attempt in range(1, self.max_retries + 1):
+            updated_client, elapsed, transactions = await cycle.async_run_in_executor(
+                self.hass, self._update_once, self.rtt.timeout, cycle
+            )
+            # The first attempt was paid for up front with the full update
+            # cost, settle the difference. Retries are charged as they go, a
+            # slave that does not even accept the connection costs one.
+            prepaid = UPDATE_TRANSACTIONS if attempt == 1 else 0
+            self._limiter.charge(transactions - prepaid)
+            self._limiter.record(elapsed, transactions)
             
             if updated_client:
+                self.rtt.add_sample(elapsed / max(transactions, 1))
                 # Update our reference to the client with the new one containing updated registers
                 # We do NOT close the connection of the new client yet if we want to be safe,
                 # but since we are in "on-demand" mode, we should close it.
@@ -89,6 +234,7 @@ class SmartyCoordinator(DataUpdateCoordinator[None]):
                      await self.hass.async_add_executor_job(updated_client.connection.close)
                 
                 self.client = updated_client
+                self._record_history()
                 
                 if attempt > 1:
                     _LOGGER.debug(
@@ -98,21 +244,64 @@ class SmartyCoordinator(DataUpdateCoordinator[None]):
                     )
                 return
 
-            if attempt < MAX_RETRIES:
+            self.rtt.backoff()
+            _LOGGER.debug(
+                "Slave %d: Attempt %d failed, timeout backed off to %.2fs",
+                self.slave,
+                attempt,
+                self.rtt.timeout,
+            )
+
+            if attempt < self.max_retries:
                 await asyncio.sleep(RETRY_DELAY)
 
         raise UpdateFailed(
-            f"Failed to update Smarty data for slave {self.slave} after {MAX_RETRIES} attempts"
+            f"Failed to update Smarty data for slave {self.slave} after {self.max_retries} attempts"
         )
         
+    def _record_history(self) -> None:
+        """Add the freshly decoded values to the rolling windows."""
+        now = time.monotonic()
+        if (
+            self._history_recorded is not None
+            and now - self._history_recorded < HISTORY_SPACING
+        ):
+            return
+        self._history_recorded = now
+        for key, value_fn in HISTORY_METRICS.items():
+            if (value := value_fn(self.client)) is not None:
+                self.history[key].add(now, value)
+
     async def execute_command(self, func: Callable[[Smarty], Any]) -> Any:
         """Execute a command using a temporary on-demand connection."""
-        async with self._modbus_lock:
-            return await self.hass.async_add_executor_job(self._execute_command_sync, func)
+        profiler = self.profiler
+        cycle = NULL_CYCLE if profiler is None else profiler.start_cycle("command")
+        try:
+            await cycle.async_wait_budget(
+                self._limiter, COMMAND_TRANSACTIONS, background=False
+            )
+            async with cycle.acquire(self._modbus_lock):
+                start = time.monotonic()
+                try:
+                    return await cycle.async_run_in_executor(
+                        self.hass,
+                        self._execute_command_sync,
+                        func,
+                        self.rtt.timeout,
+                        cycle,
+                    )
+                finally:
+                    self._limiter.record(time.monotonic() - start, COMMAND_TRANSACTIONS)
+        finally:
+            if profiler is not None:
+                self._end_profile_cycle(profiler, cycle)
 
-    def _execute_command_sync(self, func: Callable[[Smarty], Any]) -> Any:
+    def _execute_command_sync(
+        self, func: Callable[[Smarty], Any], timeout: float, cycle: NullProfileCycle
+    ) -> Any:
         """Synchronous helper to execute command with ephemeral connection."""
-        client = Smarty(host=self.config_entry.data[CONF_HOST], device_id=self.slave)
+        client = self._create_client(timeout)
+        cycle.instrument(client)
         try:
             # We assume the command (func) will open/use the connection.
             # But pysmarty2 usually opens connection in __init__.
@@ -126,6 +315,7 @@ class SmartyCoordinator(DataUpdateCoordinator[None]):
                     pass
 
     async def _async_setup(self) -> None:
+        await self._limiter.async_acquire(UPDATE_TRANSACTIONS, background=True)
         async with self._modbus_lock:
             await self._async_update_with_retry()
             # Since we just updated, self.client has data.
@@ -135,8 +325,82 @@ class SmartyCoordinator(DataUpdateCoordinator[None]):
             # This should work without active connection if registers are populated.
             self.software_version = self.client.get_software_version()
             self.configuration_version = self.client.get_configuration_version()
+            self.device_info = DeviceInfo(
+                identifiers={(DOMAIN, f"{self.config_entry.entry_id}_{self.slave}")},
+                name=f"Smarty (Slave {self.slave})",
+                manufacturer="Salda",
+                sw_version=self.software_version,
+                hw_version=self.configuration_version,
+            )
+
+    async def async_start(self) -> None:
+        """Fetch initial data for a slave added while the entry is loaded."""
+        await self._async_setup()
+        self.async_set_updated_data(None)
 
     async def _async_update_data(self) -> None:
         """Fetch data from Smarty."""
-        async with self._modbus_lock:
-            await self._async_update_with_retry()
+        profiler = self.profiler
+        cycle = NULL_CYCLE if profiler is None else profiler.start_cycle("update")
+        try:
+            await cycle.async_wait_budget(
+                self._limiter, UPDATE_TRANSACTIONS, background=True
+            )
+            async with cycle.acquire(self._modbus_lock):
+                await self._async_update_with_retry(cycle)
+        finally:
+            if profiler is not None:
+                self._end_profile_cycle(profiler, cycle)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners."""
+        if (profiler := self.profiler) is None:
+            super().async_update_listeners()
+            return
+
+        start = time.perf_counter()
+        super().async_update_listeners()
+        profiler.add_state_write(time.perf_counter() - start)
+
+    def _end_profile_cycle(
+        self, profiler: SmartyProfiler, cycle: NullProfileCycle
+    ) -> None:
+        """Record a profiled cycle and finish the session once it is complete."""
+        if profiler.finished.is_set():
+            # The session timed out, stop profiling this slave
+            self._async_finish_profile(profiler)
+            return
+        if profiler.done:
+            return
+        profiler.end_cycle(cycle)
+        if profiler.done:
+            # Finish on the next loop iteration so the state writes that
+            # follow the last update are still recorded
+            self.hass.loop.call_soon(self._async_finish_profile, profiler)
+
+    @callback
+    def _async_finish_profile(self, profiler: SmartyProfiler) -> None:
+        """Stop profiling and log the results."""
+        if self.profiler is profiler:
+            self.profiler = None
+        profiler.finish()
+
+    @property
+    def has_listeners(self) -> bool:
+        """Return whether any entity listens, the slave is not polled otherwise."""
+        return bool(self._listeners)
+
+    @callback
+    def async_start_profile(self, cycles: int) -> SmartyProfiler | None:
+        """Profile the next cycles, return None if a session is running."""
+        if self.profiler is not None and not self.profiler.finished.is_set():
+            return None
+        self.profiler = SmartyProfiler(self.slave, cycles)
+        return self.profiler
+
+    async def async_shutdown(self) -> None:
+        """Cancel any listeners and finish a running profile."""
+        if (profiler := self.profiler) is not None:
+            self._async_finish_profile(profiler)
+        await super().async_shutdown()
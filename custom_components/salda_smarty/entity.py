@@ -1,10 +1,69 @@
 """Smarty Entity class."""
 
-from homeassistant.helpers.device_registry import DeviceInfo
+from collections.abc import Callable, Iterable
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import SmartyCoordinator
+from .const import SIGNAL_ADD_SLAVE
+from .coordinator import SmartyConfigEntry, SmartyCoordinator
+
+
+def slave_unique_id(coordinator: SmartyCoordinator, key: str | None = None) -> str:
+    """Return the unique id of a slave entity."""
+    unique_id = f"{coordinator.config_entry.entry_id}_{coordinator.slave}"
+    return unique_id if key is None else f"{unique_id}_{key}"
+
+
+@callback
+def async_disabled_unique_ids(
+    hass: HomeAssistant, entry: SmartyConfigEntry, platform: Platform
+) -> set[str]:
+    """Return the unique ids of the platform entities the user disabled."""
+    return {
+        entity.unique_id
+        for entity in er.async_entries_for_config_entry(
+            er.async_get(hass), entry.entry_id
+        )
+        if entity.domain == platform and entity.disabled_by is not None
+    }
+
+
+@callback
+def async_setup_slave_entities(
+    hass: HomeAssistant,
+    entry: SmartyConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+    platform: Platform,
+    entities_fn: Callable[[SmartyCoordinator, Callable[[str], bool]], Iterable[Entity]],
+) -> None:
+    """Add entities for every slave, including slaves added later on.
+
+    ``entities_fn`` is given a filter on unique ids so that entities the
+    user disabled are never instantiated. Enabling one reloads the entry.
+    """
+    disabled = async_disabled_unique_ids(hass, entry, platform)
+
+    def _enabled(unique_id: str) -> bool:
+        return unique_id not in disabled
+
+    @callback
+    def _async_add_slave(coordinator: SmartyCoordinator) -> None:
+        async_add_entities(entities_fn(coordinator, _enabled))
+
+    for coordinator in entry.runtime_data.coordinators.values():
+        _async_add_slave(coordinator)
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_ADD_SLAVE.format(entry.entry_id), _async_add_slave
+        )
+    )
 
 
 class SmartyEntity(CoordinatorEntity[SmartyCoordinator]):
@@ -15,10 +74,5 @@ class SmartyEntity(CoordinatorEntity[SmartyCoordinator]):
     def __init__(self, coordinator: SmartyCoordinator) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{coordinator.config_entry.entry_id}_{coordinator.slave}")},
-            name=f"Smarty (Slave {coordinator.slave})",
-            manufacturer="Salda",
-            sw_version=self.coordinator.software_version,
-            hw_version=self.coordinator.configuration_version,
-        )
+        # Built once per slave and shared by all of its entities
+        self._attr_device_info = coordinator.device_info
@@ -7,6 +7,7 @@ import math
 from typing import Any
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
@@ -18,7 +19,7 @@ from homeassistant.util.scaling import int_states_in_range
 
 from . import SmartyConfigEntry
 from .coordinator import SmartyCoordinator
-from .entity import SmartyEntity
+from .entity import SmartyEntity, async_setup_slave_entities, slave_unique_id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,10 +33,14 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up the Smarty Fan Platform."""
-    coordinators = entry.runtime_data
-
-    async_add_entities(
-        SmartyFan(coordinator) for coordinator in coordinators.values()
+    async_setup_slave_entities(
+        hass,
+        entry,
+        async_add_entities,
+        Platform.FAN,
+        lambda coordinator, enabled: (
+            (SmartyFan(coordinator),) if enabled(slave_unique_id(coordinator)) else ()
+        ),
     )
 
 
@@ -54,7 +59,7 @@ class SmartyFan(SmartyEntity, FanEntity):
         """Initialize the entity."""
         super().__init__(coordinator)
         self._smarty_fan_speed = 0
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{coordinator.slave}"
+        self._attr_unique_id = slave_unique_id(coordinator)
 
     @property
     def is_on(self) -> bool:
@@ -0,0 +1,137 @@
+"""In-memory history of decoded Smarty values."""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+
+
+class RollingWindow:
+    """Ring buffer of timestamped samples with incremental statistics.
+
+    Memory is fixed by the capacity. Samples are dropped when the buffer is
+    full or when they are older than the maximum age. The mean and the least
+    squares trend are kept as running sums, the minimum and maximum as
+    monotonic queues, so adding a sample and reading the statistics are
+    both amortized O(1).
+    """
+
+    def __init__(self, capacity: int, max_age: float) -> None:
+        """Initialize."""
+        self.capacity = capacity
+        self.max_age = max_age
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        # Sample n is stored at slot n % capacity
+        self._next = 0
+        self._count = 0
+        # Times are taken relative to an origin to keep the sums small
+        self._origin = 0.0
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._sum_xx = 0.0
+        self._sum_xy = 0.0
+        self._min: deque[int] = deque()
+        self._max: deque[int] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return self._count
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a sample, evicting the ones that fall out of the window."""
+        while self._count and (
+            self._count == self.capacity
+            or timestamp - self._times[self._oldest % self.capacity] > self.max_age
+        ):
+            self._evict()
+
+        if not self._count:
+            self._origin = timestamp
+
+        slot = self._next % self.capacity
+        self._times[slot] = timestamp
+        self._values[slot] = value
+        x = timestamp - self._origin
+        self._sum_x += x
+        self._sum_y += value
+        self._sum_xx += x * x
+        self._sum_xy += x * value
+
+        while self._min and self._values[self._min[-1] % self.capacity] >= value:
+            self._min.pop()
+        self._min.append(self._next)
+        while self._max and self._values[self._max[-1] % self.capacity] <= value:
+            self._max.pop()
+        self._max.append(self._next)
+
+        self._next += 1
+        self._count += 1
+
+        # Recompute the sums once per lap to shed floating point drift
+        if self._next % self.capacity == 0:
+            self._rebase()
+
+    @property
+    def _oldest(self) -> int:
+        """Return the sample number of the oldest sample."""
+        return self._next - self._count
+
+    def _evict(self) -> None:
+        """Drop the oldest sample."""
+        oldest = self._oldest
+        slot = oldest % self.capacity
+        x = self._times[slot] - self._origin
+        value = self._values[slot]
+        self._sum_x -= x
+        self._sum_y -= value
+        self._sum_xx -= x * x
+        self._sum_xy -= x * value
+        if self._min[0] == oldest:
+            self._min.popleft()
+        if self._max[0] == oldest:
+            self._max.popleft()
+        self._count -= 1
+
+    def _rebase(self) -> None:
+        """Move the origin to the oldest sample and recompute the sums."""
+        self._origin = self._times[self._oldest % self.capacity]
+        self._sum_x = self._sum_y = self._sum_xx = self._sum_xy = 0.0
+        for sample in range(self._oldest, self._next):
+            slot = sample % self.capacity
+            x = self._times[slot] - self._origin
+            value = self._values[slot]
+            self._sum_x += x
+            self._sum_y += value
+            self._sum_xx += x * x
+            self._sum_xy += x * value
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the window."""
+        if not self._count:
+            return None
+        return self._sum_y / self._count
+
+    @property
+    def minimum(self) -> float | None:
+        """Return the minimum of the window."""
+        if not self._count:
+            return None
+        return self._values[self._min[0] % self.capacity]
+
+    @property
+    def maximum(self) -> float | None:
+        """Return the maximum of the window."""
+        if not self._count:
+            return None
+        return self._values[self._max[0] % self.capacity]
+
+    @property
+    def slope(self) -> float | None:
+        """Return the least squares trend in units per second."""
+        n = self._count
+        denominator = n * self._sum_xx - self._sum_x * self._sum_x
+        if n < 2 or denominator <= 0:
+            return None
+        return (n * self._sum_xy - self._sum_x * self._sum_y) / denominator
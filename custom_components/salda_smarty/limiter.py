@@ -0,0 +1,87 @@
+"""Bus budget enforcement for a Smarty Modbus gateway."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import time
+
+# Tokens held back for user commands, background polls never spend them
+COMMAND_RESERVE_SECONDS = 1.0
+BURST_SECONDS = 5.0
+UTILIZATION_WINDOW = 60.0  # seconds
+
+
+class BusLimiter:
+    """Token bucket limiting the Modbus transactions sent to one gateway.
+
+    Tokens are transactions and refill at the configured rate. Background
+    polls wait until the bucket holds their cost on top of a reserve, so
+    under pressure they run less often while user commands, which may spend
+    the reserve, keep going through. Retries are charged without waiting
+    and can leave the bucket in debt, which slows the following polls.
+    """
+
+    def __init__(self, rate: float) -> None:
+        """Initialize."""
+        self.rate = rate
+        self.reserve = rate * COMMAND_RESERVE_SECONDS
+        self.burst = rate * BURST_SECONDS
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        # (finished at, busy seconds, transactions) of recent requests
+        self._usage: deque[tuple[float, float, int]] = deque()
+
+    def set_rate(self, rate: float) -> None:
+        """Change the budget in transactions per second."""
+        self._refill()
+        self.rate = rate
+        self.reserve = rate * COMMAND_RESERVE_SECONDS
+        self.burst = rate * BURST_SECONDS
+        self._tokens = min(self._tokens, self.burst)
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self._tokens + (now - self._updated) * self.rate, self.burst)
+        self._updated = now
+
+    async def async_acquire(self, cost: int, background: bool) -> None:
+        """Wait until the budget allows a request of the given cost."""
+        while True:
+            # A request larger than the bucket would otherwise wait forever
+            floor = min(cost + (self.reserve if background else 0.0), self.burst)
+            self._refill()
+            if self._tokens >= floor:
+                self._tokens -= cost
+                return
+            await asyncio.sleep((floor - self._tokens) / self.rate)
+
+    def charge(self, cost: int) -> None:
+        """Spend tokens without waiting, a negative cost refunds them."""
+        self._refill()
+        self._tokens = min(self._tokens - cost, self.burst)
+
+    def record(self, busy: float, transactions: int) -> None:
+        """Record time the bus was busy with a request."""
+        now = time.monotonic()
+        self._usage.append((now, busy, transactions))
+        self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        """Forget requests that left the utilization window."""
+        while self._usage and now - self._usage[0][0] > UTILIZATION_WINDOW:
+            self._usage.popleft()
+
+    @property
+    def utilization(self) -> float:
+        """Return the percentage of bus time used over the window."""
+        self._prune(time.monotonic())
+        busy = sum(usage[1] for usage in self._usage)
+        return min(busy / UTILIZATION_WINDOW * 100, 100.0)
+
+    @property
+    def transactions_per_second(self) -> float:
+        """Return the transaction rate over the window."""
+        self._prune(time.monotonic())
+        return sum(usage[2] for usage in self._usage) / UTILIZATION_WINDOW
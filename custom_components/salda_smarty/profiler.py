@@ -0,0 +1,248 @@
+"""On-demand profiling of the Smarty update and command paths."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+import cProfile
+import functools
+import io
+import logging
+import pstats
+import time
+from typing import Any
+
+from pysmarty2 import Smarty
+
+from homeassistant.core import HomeAssistant
+
+from .limiter import BusLimiter
+
+_LOGGER = logging.getLogger(__name__)
+
+PHASES = (
+    "budget_wait",
+    "lock_wait",
+    "executor_handoff",
+    "modbus_io",
+    "decoding",
+    "state_write",
+)
+TOP_FUNCTIONS = 20
+
+# Methods of the pymodbus client that perform a Modbus transaction
+_IO_METHODS = ("connect", "execute")
+
+
+class NullProfileCycle:
+    """Cycle used when profiling is off, it only does the actual work."""
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Discard a phase timing."""
+
+    async def async_wait_budget(
+        self, limiter: BusLimiter, cost: int, background: bool
+    ) -> None:
+        """Wait for the bus budget."""
+        await limiter.async_acquire(cost, background)
+
+    def acquire(self, lock: asyncio.Lock) -> AbstractAsyncContextManager[Any]:
+        """Return the Modbus lock itself."""
+        return lock
+
+    async def async_run_in_executor(
+        self, hass: HomeAssistant, target: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Run a job in the executor."""
+        return await hass.async_add_executor_job(target, *args)
+
+    def instrument(self, client: Smarty) -> None:
+        """Leave the client untouched."""
+
+
+NULL_CYCLE = NullProfileCycle()
+
+
+class ProfileCycle(NullProfileCycle):
+    """Phase timings of a single update or command."""
+
+    def __init__(self, kind: str) -> None:
+        """Initialize."""
+        self.kind = kind
+        self.phases: dict[str, float] = defaultdict(float)
+        # execute connects through the instrumented connect, only the
+        # outermost call is timed so nothing is counted twice
+        self._io_depth = 0
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time spent in a phase."""
+        self.phases[phase] += seconds
+
+    async def async_wait_budget(
+        self, limiter: BusLimiter, cost: int, background: bool
+    ) -> None:
+        """Wait for the bus budget, recording the wait."""
+        start = time.perf_counter()
+        await limiter.async_acquire(cost, background)
+        self.add("budget_wait", time.perf_counter() - start)
+
+    @asynccontextmanager
+    async def acquire(self, lock: asyncio.Lock) -> AsyncIterator[None]:
+        """Acquire the Modbus lock, recording the wait."""
+        start = time.perf_counter()
+        async with lock:
+            self.add("lock_wait", time.perf_counter() - start)
+            yield
+
+    async def async_run_in_executor(
+        self, hass: HomeAssistant, target: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Run a job in the executor, recording where its time goes.
+
+        Time between submitting the job and it running, and between it
+        finishing and the result reaching the event loop, is counted as
+        executor hand-off. Time inside the job not spent in Modbus
+        transactions, as timed by ``instrument``, is counted as decoding.
+        """
+        submitted = time.perf_counter()
+        started = ended = 0.0
+        io_before = self.phases["modbus_io"]
+
+        def _run() -> Any:
+            nonlocal started, ended
+            started = time.perf_counter()
+            try:
+                return target(*args)
+            finally:
+                ended = time.perf_counter()
+
+        try:
+            return await hass.async_add_executor_job(_run)
+        finally:
+            if started:
+                self.add(
+                    "executor_handoff",
+                    (started - submitted) + (time.perf_counter() - ended),
+                )
+                modbus_io = self.phases["modbus_io"] - io_before
+                self.add("decoding", max(ended - started - modbus_io, 0.0))
+
+    def instrument(self, client: Smarty) -> None:
+        """Time the Modbus transactions of a client created for this cycle."""
+        modbus_client = client.connection.client
+        for name in _IO_METHODS:
+            setattr(modbus_client, name, self._timed(getattr(modbus_client, name)))
+
+    def _timed(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a client method so its duration counts as Modbus I/O."""
+
+        @functools.wraps(method)
+        def _wrapper(*args: Any, **kwargs: Any) -> Any:
+            if self._io_depth:
+                return method(*args, **kwargs)
+            self._io_depth += 1
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._io_depth -= 1
+                self.add("modbus_io", time.perf_counter() - start)
+
+        return _wrapper
+
+
+class SmartyProfiler:
+    """Collect phase timings for a fixed number of coordinator cycles."""
+
+    def __init__(self, slave: int, cycles: int) -> None:
+        """Initialize."""
+        self.slave = slave
+        self.cycles = cycles
+        self.counts: dict[str, int] = defaultdict(int)
+        self.totals: dict[str, dict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        self.finished = asyncio.Event()
+
+    @property
+    def done(self) -> bool:
+        """Return whether enough cycles have been recorded."""
+        return sum(self.counts.values()) >= self.cycles
+
+    def start_cycle(self, kind: str) -> ProfileCycle:
+        """Start recording an update or command."""
+        return ProfileCycle(kind)
+
+    def end_cycle(self, cycle: NullProfileCycle) -> None:
+        """Fold a finished cycle into the totals."""
+        if self.done or not isinstance(cycle, ProfileCycle):
+            return
+        self.counts[cycle.kind] += 1
+        for phase, seconds in cycle.phases.items():
+            self.totals[cycle.kind][phase] += seconds
+
+    def add_state_write(self, seconds: float) -> None:
+        """Record time spent writing entity states after an update."""
+        self.totals["update"]["state_write"] += seconds
+
+    def finish(self) -> None:
+        """Log the summary of the recorded cycles."""
+        if self.finished.is_set():
+            return
+        lines = [f"Slave {self.slave}: Profile summary"]
+        for kind, count in self.counts.items():
+            phases = ", ".join(
+                f"{phase} {self.totals[kind][phase] / count * 1000:.1f} ms"
+                for phase in PHASES
+                if phase in self.totals[kind]
+            )
+            lines.append(f"  {kind} ({count} cycles, mean per cycle): {phases}")
+        _LOGGER.info("\n".join(lines))
+        self.finished.set()
+
+
+async def async_profile_process(
+    hass: HomeAssistant, profilers: list[SmartyProfiler], timeout: float
+) -> None:
+    """Run cProfile until every slave profiler has finished.
+
+    A session never outlasts the timeout, profilers still short of their
+    cycles by then are finished with what they recorded.
+
+    cProfile cannot be limited to the Smarty code paths: on Python 3.12 and
+    later it records every thread of the process, so the pstats file covers
+    all of Home Assistant while the slaves are being profiled. The per-phase
+    timings logged for each slave are measured directly and are not affected.
+    """
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError:
+        _LOGGER.warning("Another profiler is active, no pstats file is written")
+        return
+    try:
+        async with asyncio.timeout(timeout):
+            await asyncio.gather(
+                *(profiler.finished.wait() for profiler in profilers)
+            )
+    except TimeoutError:
+        _LOGGER.info("Profile timed out after %d seconds", timeout)
+        for profiler in profilers:
+            profiler.finish()
+    finally:
+        profile.disable()
+
+    path = hass.config.path(f"salda_smarty.{int(time.time())}.prof")
+    top = await hass.async_add_executor_job(_write_stats, profile, path)
+    _LOGGER.info("Process profile written to %s\n%s", path, top)
+
+
+def _write_stats(profile: cProfile.Profile, path: str) -> str:
+    """Dump the profile and return the top functions."""
+    stream = io.StringIO()
+    stats = pstats.Stats(profile, stream=stream)
+    stats.dump_stats(path)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+    return stream.getvalue()
@@ -0,0 +1,84 @@
+"""Round-trip time estimation for Smarty Modbus slaves."""
+
+from __future__ import annotations
+
+from .const import DEFAULT_MAX_TIMEOUT, DEFAULT_MIN_TIMEOUT
+
+# Estimator gains and RTO multiplier from RFC 6298
+RTT_ALPHA = 0.125
+RTT_BETA = 0.25
+RTT_K = 4
+
+INITIAL_TIMEOUT = 3.0  # seconds, pymodbus default
+
+
+class RttEstimator:
+    """Track a smoothed round-trip time for a single slave.
+
+    The estimate follows the TCP retransmission timer: an exponentially
+    weighted moving average of the samples plus a multiple of their mean
+    deviation, clamped between a floor and a ceiling. Failed requests back
+    the timeout off exponentially within an update cycle, never beyond the
+    fixed pymodbus default unless the estimate itself is higher, and the
+    backoff is dropped again when the next cycle starts.
+    """
+
+    def __init__(
+        self,
+        min_timeout: float = DEFAULT_MIN_TIMEOUT,
+        max_timeout: float = DEFAULT_MAX_TIMEOUT,
+        initial_timeout: float = INITIAL_TIMEOUT,
+    ) -> None:
+        """Initialize."""
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.initial_timeout = initial_timeout
+        self.srtt: float | None = None
+        self.rttvar: float | None = None
+        self._timeout = self._estimate()
+
+    @property
+    def timeout(self) -> float:
+        """Return the timeout to use for the next request."""
+        return self._timeout
+
+    def _clamp(self, value: float) -> float:
+        """Keep a timeout within the configured bounds."""
+        return min(max(value, self.min_timeout), self.max_timeout)
+
+    def _estimate(self) -> float:
+        """Return the timeout derived from the samples, without backoff."""
+        if self.srtt is None or self.rttvar is None:
+            return self._clamp(self.initial_timeout)
+        return self._clamp(self.srtt + RTT_K * self.rttvar)
+
+    def add_sample(self, rtt: float) -> None:
+        """Fold a measured round-trip time into the estimate."""
+        if self.srtt is None or self.rttvar is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - RTT_BETA) * self.rttvar + RTT_BETA * abs(
+                self.srtt - rtt
+            )
+            self.srtt = (1 - RTT_ALPHA) * self.srtt + RTT_ALPHA * rtt
+        self._timeout = self._estimate()
+
+    def set_bounds(self, min_timeout: float, max_timeout: float) -> None:
+        """Change the floor and ceiling without losing the estimate."""
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self._timeout = self._estimate()
+
+    def backoff(self) -> None:
+        """Double the timeout after a failed request.
+
+        The backoff is capped at the fixed timeout used before adaptive
+        timeouts, so a dead slave never costs more than it used to.
+        """
+        ceiling = max(self._estimate(), self.initial_timeout)
+        self._timeout = self._clamp(min(self._timeout * 2, ceiling))
+
+    def reset(self) -> None:
+        """Drop any backoff, at the start of an update cycle."""
+        self._timeout = self._estimate()
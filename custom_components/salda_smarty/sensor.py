@@ -6,6 +6,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
+from typing import Any
 
 from pysmarty2 import Smarty
 
@@ -13,14 +14,30 @@ from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    CONF_HOST,
+    PERCENTAGE,
+    REVOLUTIONS_PER_MINUTE,
+    EntityCategory,
+    Platform,
+    UnitOfTemperature,
 )
-from homeassistant.const import REVOLUTIONS_PER_MINUTE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.util import dt as dt_util
 
-from .coordinator import SmartyConfigEntry, SmartyCoordinator
-from .entity import SmartyEntity
+from .const import DOMAIN
+from .coordinator import HISTORY_METRICS, SmartyConfigEntry, SmartyCoordinator
+from .entity import (
+    SmartyEntity,
+    async_disabled_unique_ids,
+    async_setup_slave_entities,
+    slave_unique_id,
+)
+from .history import RollingWindow
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -82,19 +99,76 @@ ENTITIES: tuple[SmartySensorDescription, ...] = (
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class SmartyStatisticSensorDescription(SensorEntityDescription):
+    """Class describing Smarty rolling statistic sensor."""
+
+    metric: str
+    statistic_fn: Callable[[RollingWindow], float | None]
+
+
+def _trend_per_hour(window: RollingWindow) -> float | None:
+    """Return the trend of the window in units per hour."""
+    if (slope := window.slope) is not None:
+        return slope * 3600
+    return None
+
+
+# Disabled by default: once enabled, each one writes a state row whenever
+# its rounded value changes, which for the mean and trend is most polls.
+STATISTIC_ENTITIES: tuple[SmartyStatisticSensorDescription, ...] = tuple(
+    SmartyStatisticSensorDescription(
+        key=f"{description.key}_{statistic}",
+        translation_key=f"{description.key}_{statistic}",
+        device_class=None if statistic == "trend" else description.device_class,
+        native_unit_of_measurement=(
+            f"{description.native_unit_of_measurement}/h"
+            if statistic == "trend"
+            else description.native_unit_of_measurement
+        ),
+        entity_registry_enabled_default=False,
+        metric=description.key,
+        statistic_fn=statistic_fn,
+    )
+    for description in ENTITIES
+    if description.key in HISTORY_METRICS
+    for statistic, statistic_fn in (
+        ("mean", lambda window: window.mean),
+        ("min", lambda window: window.minimum),
+        ("max", lambda window: window.maximum),
+        ("trend", _trend_per_hour),
+    )
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: SmartyConfigEntry,
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up the Smarty Sensor Platform."""
-    coordinators = entry.runtime_data
-
-    async_add_entities(
-        SmartySensor(coordinator, description)
-        for coordinator in coordinators.values()
-        for description in ENTITIES
+    async_setup_slave_entities(
+        hass,
+        entry,
+        async_add_entities,
+        Platform.SENSOR,
+        lambda coordinator, enabled: [
+            *(
+                SmartySensor(coordinator, description)
+                for description in ENTITIES
+                if enabled(slave_unique_id(coordinator, description.key))
+            ),
+            *(
+                SmartyStatisticSensor(coordinator, description)
+                for description in STATISTIC_ENTITIES
+                if enabled(slave_unique_id(coordinator, description.key))
+            ),
+        ],
     )
+    if f"{entry.entry_id}_bus_utilization" not in async_disabled_unique_ids(
+        hass, entry, Platform.SENSOR
+    ):
+        async_add_entities([SmartyBusUtilizationSensor(entry)])
 
 
 class SmartySensor(SmartyEntity, SensorEntity):
@@ -110,11 +184,68 @@ class SmartySensor(SmartyEntity, SensorEntity):
         """Initialize the entity."""
         super().__init__(coordinator)
         self.entity_description = entity_description
-        self._attr_unique_id = (
-            f"{coordinator.config_entry.entry_id}_{coordinator.slave}_{entity_description.key}"
-        )
+        self._attr_unique_id = slave_unique_id(coordinator, entity_description.key)
 
     @property
     def native_value(self) -> float | datetime | None:
         """Return the state of the sensor."""
         return self.entity_description.value_fn(self.coordinator.client)
+
+
+class SmartyStatisticSensor(SmartyEntity, SensorEntity):
+    """Rolling statistic of a Smarty sensor over the last hour."""
+
+    entity_description: SmartyStatisticSensorDescription
+
+    def __init__(
+        self,
+        coordinator: SmartyCoordinator,
+        entity_description: SmartyStatisticSensorDescription,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self.entity_description = entity_description
+        self._attr_unique_id = slave_unique_id(coordinator, entity_description.key)
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the statistic, rounded so small jitter causes no state change."""
+        window = self.coordinator.history[self.entity_description.metric]
+        if (value := self.entity_description.statistic_fn(window)) is not None:
+            return round(value, 1)
+        return None
+
+
+class SmartyBusUtilizationSensor(SensorEntity):
+    """Share of the gateway bus time used by the integration."""
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "bus_utilization"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 1
+    # Not tied to a coordinator, refreshed on the platform scan interval
+    _attr_should_poll = True
+
+    def __init__(self, entry: SmartyConfigEntry) -> None:
+        """Initialize the entity."""
+        self._limiter = entry.runtime_data.limiter
+        self._attr_unique_id = f"{entry.entry_id}_bus_utilization"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=f"Smarty gateway ({entry.data[CONF_HOST]})",
+        )
+
+    @property
+    def native_value(self) -> float:
+        """Return the bus utilization over the last minute."""
+        return self._limiter.utilization
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the transaction rate and the configured budget."""
+        return {
+            "transactions_per_second": round(self._limiter.transactions_per_second, 2),
+            "budget": self._limiter.rate,
+        }
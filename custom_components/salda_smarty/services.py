@@ -0,0 +1,71 @@
+"""Services for the Smarty integration."""
+
+from __future__ import annotations
+
+import logging
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN
+from .coordinator import SmartyConfigEntry
+from .profiler import SmartyProfiler, async_profile_process
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_PROFILE = "profile"
+ATTR_CYCLES = "cycles"
+ATTR_TIMEOUT = "timeout"
+DEFAULT_PROFILE_CYCLES = 5
+DEFAULT_PROFILE_TIMEOUT = 600  # seconds
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CYCLES, default=DEFAULT_PROFILE_CYCLES): vol.All(
+            cv.positive_int, vol.Range(min=1, max=100)
+        ),
+        vol.Optional(ATTR_TIMEOUT, default=DEFAULT_PROFILE_TIMEOUT): vol.All(
+            cv.positive_int, vol.Range(min=10, max=3600)
+        ),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Smarty services."""
+
+    async def _async_profile(call: ServiceCall) -> None:
+        """Profile the next update and command cycles of every slave."""
+        cycles: int = call.data[ATTR_CYCLES]
+        timeout: int = call.data[ATTR_TIMEOUT]
+        entries: list[SmartyConfigEntry] = hass.config_entries.async_entries(DOMAIN)
+        profilers: list[SmartyProfiler] = []
+        for entry in entries:
+            if entry.state is not ConfigEntryState.LOADED:
+                continue
+            for coordinator in entry.runtime_data.coordinators.values():
+                if not coordinator.has_listeners:
+                    _LOGGER.debug(
+                        "Slave %d: Not profiled, all of its entities are disabled",
+                        coordinator.slave,
+                    )
+                    continue
+                if (profiler := coordinator.async_start_profile(cycles)) is None:
+                    _LOGGER.warning(
+                        "Slave %d: A profile is already running", coordinator.slave
+                    )
+                else:
+                    profilers.append(profiler)
+
+        if profilers:
+            hass.async_create_background_task(
+                async_profile_process(hass, profilers, timeout), f"{DOMAIN} profile"
+            )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, _async_profile, schema=PROFILE_SCHEMA
+    )
@@ -0,0 +1,247 @@
+"""Measure the setup cost per slave against a stubbed Modbus client.
+
+Sets up N coordinators and forwards the entry to the platforms the way the
+integration does at startup, without a gateway, and reports the time and
+the memory allocated with this package on the stack. Unlike a measurement
+inside a running Home Assistant, no Modbus I/O or other integration is
+part of the result.
+
+Each slave count is set up twice: first with an empty entity registry, as
+on the very first start, then with the registry a first start leaves
+behind, where the disabled by default entities are registered disabled
+and therefore not created.
+
+Run from the repository root with Home Assistant installed:
+
+    python scripts/benchmark_startup.py --slaves 1 8 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+import importlib
+from pathlib import Path
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import MappingProxyType
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from homeassistant.config_entries import ConfigEntry  # noqa: E402
+from homeassistant.const import CONF_HOST, Platform  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import entity_registry as er  # noqa: E402
+from homeassistant.helpers.entity import Entity  # noqa: E402
+
+from custom_components.salda_smarty import (  # noqa: E402
+    _platforms_to_load,
+    coordinator as coordinator_module,
+)
+from custom_components.salda_smarty.const import CONF_SLAVES, DOMAIN  # noqa: E402
+from custom_components.salda_smarty.coordinator import (  # noqa: E402
+    SmartyConfigEntry,
+    SmartyCoordinator,
+    SmartyData,
+    get_slaves,
+)
+from custom_components.salda_smarty.limiter import BusLimiter  # noqa: E402
+
+PACKAGE_DIR = ROOT / "custom_components" / "salda_smarty"
+TRACE_FILTERS = [tracemalloc.Filter(True, str(PACKAGE_DIR / "*"), all_frames=True)]
+TRACEBACK_FRAMES = 25
+TOP_LINES = 10
+
+
+class StubModbusClient:
+    """Modbus client that answers without any I/O."""
+
+    socket = None
+
+    def connect(self) -> bool:
+        """Pretend to connect."""
+        return True
+
+    def execute(self, *args: Any, **kwargs: Any) -> None:
+        """Pretend to send a request."""
+
+
+class StubConnection:
+    """Connection holding the stub client."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.client = StubModbusClient()
+
+    def close(self) -> None:
+        """Pretend to close."""
+
+
+class StubSmarty:
+    """Stand-in for pysmarty2.Smarty with fixed register values."""
+
+    supply_air_temperature = 20.0
+    extract_air_temperature = 22.0
+    outdoor_air_temperature = 5.0
+    supply_fan_speed = 1200
+    extract_fan_speed = 1100
+
+    def __init__(self, host: str, device_id: int) -> None:
+        """Initialize."""
+        self.connection = StubConnection()
+
+    def update(self) -> bool:
+        """Pretend to read the registers."""
+        self.connection.client.connect()
+        return True
+
+    def get_software_version(self) -> str:
+        """Return a fixed software version."""
+        return "1.0"
+
+    def get_configuration_version(self) -> str:
+        """Return a fixed configuration version."""
+        return "1.0"
+
+
+def create_entry(slaves: int) -> SmartyConfigEntry:
+    """Create a config entry for the given number of slaves."""
+    return ConfigEntry(
+        data={CONF_HOST: "stub"},
+        discovery_keys=MappingProxyType({}),
+        domain=DOMAIN,
+        minor_version=1,
+        options={CONF_SLAVES: list(range(1, slaves + 1))},
+        source="user",
+        subentries_data=None,
+        title="Benchmark",
+        unique_id=None,
+        version=1,
+    )
+
+
+def collector(entities: list[Entity]) -> Callable[..., None]:
+    """Return an add entities callback that keeps the entities in a list."""
+
+    def _add_entities(
+        new_entities: Iterable[Entity], update_before_add: bool = False, **kwargs: Any
+    ) -> None:
+        entities.extend(new_entities)
+
+    return _add_entities
+
+
+async def async_setup(
+    hass: HomeAssistant, entry: SmartyConfigEntry
+) -> tuple[dict[Platform, list[Entity]], float, float]:
+    """Set up the entry like async_setup_entry, return the created entities.
+
+    The time spent on the coordinators and on the entities is returned too.
+    """
+    start = time.perf_counter()
+    data = SmartyData(
+        coordinators={},
+        modbus_lock=asyncio.Lock(),
+        # High enough that the budget never delays the benchmark
+        limiter=BusLimiter(1e9),
+    )
+    for slave in get_slaves(entry):
+        coordinator = SmartyCoordinator(
+            hass, entry, slave, data.modbus_lock, data.limiter
+        )
+        await coordinator.async_start()
+        data.coordinators[slave] = coordinator
+    entry.runtime_data = data
+    refreshed = time.perf_counter()
+
+    entities: dict[Platform, list[Entity]] = defaultdict(list)
+    data.platforms = _platforms_to_load(hass, entry)
+    for platform in data.platforms:
+        module = importlib.import_module(f"custom_components.salda_smarty.{platform}")
+        await module.async_setup_entry(hass, entry, collector(entities[platform]))
+    end = time.perf_counter()
+
+    return entities, refreshed - start, end - refreshed
+
+
+def register_entities(
+    hass: HomeAssistant,
+    entry: SmartyConfigEntry,
+    entities: dict[Platform, list[Entity]],
+) -> None:
+    """Register the entities as Home Assistant does on the first start."""
+    registry = er.async_get(hass)
+    for platform, platform_entities in entities.items():
+        for entity in platform_entities:
+            registry.async_get_or_create(
+                platform,
+                DOMAIN,
+                entity.unique_id,
+                config_entry=entry,
+                disabled_by=(
+                    None
+                    if entity.entity_registry_enabled_default
+                    else er.RegistryEntryDisabler.INTEGRATION
+                ),
+            )
+
+
+async def async_benchmark(
+    hass: HomeAssistant, entry: SmartyConfigEntry, case: str
+) -> dict[Platform, list[Entity]]:
+    """Set up the entry once and print the cost of one slave."""
+    slaves = len(get_slaves(entry))
+    before = tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+    entities, coordinators_time, entities_time = await async_setup(hass, entry)
+    stats = (
+        tracemalloc.take_snapshot()
+        .filter_traces(TRACE_FILTERS)
+        .compare_to(before, "lineno")
+    )
+
+    used = sum(stat.size_diff for stat in stats)
+    created = sum(len(platform_entities) for platform_entities in entities.values())
+    print(
+        f"{slaves} slaves, {case}: {created} entities on "
+        f"{len(entry.runtime_data.platforms)} platforms, "
+        f"{coordinators_time * 1000 / slaves:.2f} ms coordinator, "
+        f"{entities_time * 1000 / slaves:.2f} ms entities, "
+        f"{used / 1024 / slaves:.1f} KiB per slave"
+    )
+    for stat in stats[:TOP_LINES]:
+        print(f"  {stat}")
+
+    for coordinator in entry.runtime_data.coordinators.values():
+        await coordinator.async_shutdown()
+    return entities
+
+
+async def async_main(slave_counts: list[int]) -> None:
+    """Run the benchmark for each slave count."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        await er.async_load(hass)
+        for slaves in slave_counts:
+            entry = create_entry(slaves)
+            entities = await async_benchmark(hass, entry, "first start")
+            register_entities(hass, entry, entities)
+            await async_benchmark(hass, entry, "registered")
+        await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--slaves", type=int, nargs="+", default=[1, 8, 32], help="slave counts"
+    )
+    args = parser.parse_args()
+
+    coordinator_module.Smarty = StubSmarty
+    tracemalloc.start(TRACEBACK_FRAMES)
+    asyncio.run(async_main(args.slaves))
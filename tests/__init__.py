@@ -0,0 +1 @@
+"""Tests for the Salda Smarty integration."""
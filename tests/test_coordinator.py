@@ -0,0 +1,74 @@
+"""Tests for the Smarty coordinator."""
+
+from collections.abc import Iterator
+import socket
+import socketserver
+import struct
+import threading
+
+from pysmarty2 import Smarty
+import pytest
+
+from custom_components.salda_smarty.coordinator import (
+    UPDATE_TRANSACTIONS,
+    _count_transactions,
+)
+
+# Modbus function codes answered with bits, the others answer registers
+BIT_FUNCTIONS = (1, 2)
+
+
+class StubModbusHandler(socketserver.BaseRequestHandler):
+    """Answer every Modbus TCP read with zeros."""
+
+    def handle(self) -> None:
+        """Serve requests until the client disconnects."""
+        while header := self.request.recv(7):
+            transaction_id, protocol_id, length, unit_id = struct.unpack(
+                ">HHHB", header
+            )
+            function, _address, count = struct.unpack(
+                ">BHH", self.request.recv(length - 1)
+            )
+            size = (count + 7) // 8 if function in BIT_FUNCTIONS else count * 2
+            pdu = struct.pack(">BB", function, size) + bytes(size)
+            self.request.sendall(
+                struct.pack(">HHHB", transaction_id, protocol_id, len(pdu) + 1, unit_id)
+                + pdu
+            )
+
+
+@pytest.fixture
+def modbus_port() -> Iterator[int]:
+    """Run a stub Modbus TCP server and return its port."""
+    with socketserver.ThreadingTCPServer(
+        ("127.0.0.1", 0), StubModbusHandler
+    ) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server.server_address[1]
+        server.shutdown()
+
+
+def test_update_transactions(modbus_port: int) -> None:
+    """Test a full update is counted as one connect plus its reads."""
+    client = Smarty(host="127.0.0.1", port=modbus_port, device_id=1)
+    transactions = _count_transactions(client)
+
+    assert client.update()
+    client.connection.client.close()
+
+    assert transactions[0] == UPDATE_TRANSACTIONS == 8
+
+
+def test_refused_connect_transactions() -> None:
+    """Test a refused connect is counted as a single transaction."""
+    with socket.socket() as unused:
+        unused.bind(("127.0.0.1", 0))
+        port = unused.getsockname()[1]
+    client = Smarty(host="127.0.0.1", port=port, device_id=1)
+    transactions = _count_transactions(client)
+
+    assert not client.update()
+
+    assert transactions[0] == 1